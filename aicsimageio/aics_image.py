@@ -329,7 +329,10 @@ class AICSImage(ImageContainer):
         scene_index: int
             The current operating scene index in the file.
         """
-        return self.scenes.index(self.current_scene)
+        # The base Reader already tracks the operating index, reuse it instead
+        # of scanning the scene id tuple (which is also ambiguous when scene
+        # ids are duplicated)
+        return self.reader.current_scene_index
 
     def set_scene(self, scene_id: Union[str, int]) -> None:
         """
@@ -350,12 +353,16 @@ class AICSImage(ImageContainer):
         """
         # Update current scene on the base Reader
         # This clears the base Reader's cache
+        current_scene_index_before = self.reader.current_scene_index
         self.reader.set_scene(scene_id)
 
         # Reset the data stored in the AICSImage object
-        self._xarray_dask_data = None
-        self._xarray_data = None
-        self._dims = None
+        # Only needed when the operating scene actually changed, the base
+        # Reader has already validated the requested scene either way
+        if self.reader.current_scene_index != current_scene_index_before:
+            self._xarray_dask_data = None
+            self._xarray_data = None
+            self._dims = None
 
     def _transform_data_array_to_aics_image_standard(
         self,
@@ -241,6 +241,13 @@ def clean_ome_xml_for_known_issues(xml: str) -> str:
     else:
         raise ValueError("XML does not contain a namespace")
 
+    # Precompute the namespaced tags checked per element below so the scan
+    # over (potentially thousands of) Pixels children doesn't reformat them
+    # on every iteration
+    channel_tag = f"{namespace}Channel"
+    plane_tag = f"{namespace}Plane"
+    data_tags = {f"{namespace}{t}" for t in ("BinData", "TiffData", "MetadataOnly")}
+
     # Fix MicroManager Instrument and Detector
     instrument = root.find(f"{namespace}Instrument")
     if instrument is not None:
@@ -335,19 +342,14 @@ def clean_ome_xml_for_known_issues(xml: str) -> str:
             encountered_something_besides_channel = False
             encountered_plane = False
             for child in pixels:
-                if child.tag != f"{namespace}Channel":
+                if child.tag != channel_tag:
                     encountered_something_besides_channel = True
-                if child.tag == f"{namespace}Plane":
+                if child.tag == plane_tag:
                     encountered_plane = True
-                if (
-                    encountered_something_besides_channel
-                    and child.tag == f"{namespace}Channel"
-                ):
+                if encountered_something_besides_channel and child.tag == channel_tag:
                     pixels_children_out_of_order = True
                     break
-                if encountered_plane and child.tag in [
-                    f"{namespace}{t}" for t in ["BinData", "TiffData", "MetadataOnly"]
-                ]:
+                if encountered_plane and child.tag in data_tags:
                     pixels_children_out_of_order = True
                     break
 
@@ -441,28 +441,29 @@ class DefaultReader(Reader):
                         index=0,
                     )
 
-                    # Create operating shape for the final dask array by prepending
-                    # image length to a tuple of ones that is the same length as
-                    # the sample shape
-                    operating_shape = (image_length,) + ((1,) * len(sample.shape))
-                    # Create numpy array of empty arrays for delayed get data
-                    # functions
-                    lazy_arrays: np.ndarray = np.ndarray(operating_shape, dtype=object)
-                    for indices, _ in np.ndenumerate(lazy_arrays):
-                        lazy_arrays[indices] = da.from_delayed(
+                    # Create a flat list of delayed planes to stack along a new
+                    # frame axis, avoiding the object ndarray construction and
+                    # nested-list parsing that da.block requires
+                    # The sample plane was already read to resolve shape and
+                    # dtype, reuse it as the first block instead of
+                    # re-reading the plane at compute time
+                    lazy_arrays = [da.from_array(sample)] + [
+                        da.from_delayed(
                             delayed(self._get_image_data)(
                                 fs=self._fs,
                                 path=self._path,
                                 extension=self.extension,
                                 mode=self.imageio_read_mode,
-                                index=indices[0],
+                                index=index,
                             ),
                             shape=sample.shape,
                             dtype=sample.dtype,
                         )
+                        for index in range(1, image_length)
+                    ]
 
-                    # Block them into a single dask array
-                    image_data = da.block(lazy_arrays.tolist())
+                    # Stack them into a single dask array
+                    image_data = da.stack(lazy_arrays)
 
                 # Catch all other image types as unsupported
                 # https://imageio.readthedocs.io/en/stable/userapi.html#imageio.core.format.Reader.get_length
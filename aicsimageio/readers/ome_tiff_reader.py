@@ -19,7 +19,7 @@ from ..dimensions import DEFAULT_CHUNK_DIMS, DEFAULT_DIMENSION_ORDER, DimensionN
 from ..metadata import utils as metadata_utils
 from ..types import PhysicalPixelSizes
 from ..utils import io_utils
-from .tiff_reader import TiffReader
+from .tiff_reader import TIFF_BYTE_ORDER_MARKS, TiffReader
 
 ###############################################################################
 
@@ -60,6 +60,10 @@ class OmeTiffReader(TiffReader):
     this reader will make a request to the referenced remote OME schema to validate.
     """
 
+    # Pixel sizes are static per scene, cache them instead of re-walking the
+    # OME object on every property access
+    _physical_pixel_sizes_per_scene: Optional[Dict[int, PhysicalPixelSizes]] = None
+
     @staticmethod
     def _get_ome(ome_xml: str, clean_metadata: bool = True) -> OME:
         # To clean or not to clean, that is the question
@@ -74,6 +78,13 @@ class OmeTiffReader(TiffReader):
     ) -> bool:
         try:
             with fs.open(path) as open_resource:
+                # Check the byte order mark before handing off to tifffile so
+                # that obviously-not-TIFF files are rejected without a header
+                # parse
+                if open_resource.read(2) not in TIFF_BYTE_ORDER_MARKS:
+                    return False
+
+                open_resource.seek(0)
                 with TiffFile(open_resource) as tiff:
                     # Get first page description (aka the description tag in general)
                     xml = tiff.pages[0].description
@@ -134,38 +145,63 @@ class OmeTiffReader(TiffReader):
         self.chunk_dims = chunk_dims
         self.clean_metadata = clean_metadata
 
-        # Enforce valid image
-        if not self._is_supported_image(self._fs, self._path, clean_metadata):
+        # Enforce valid image while getting and storing the ome-types object
+        # The OME XML is parsed (and optionally cleaned and validated) a single
+        # time here instead of once for the support check and once for storage
+        try:
+            with self._fs.open(self._path) as open_resource:
+                with TiffFile(open_resource) as tiff:
+                    # Get and store OME
+                    self._ome = self._get_ome(
+                        tiff.pages[0].description, self.clean_metadata
+                    )
+
+                    # Handle no images in metadata
+                    # this commonly means it is a "BinaryData" OME file
+                    # i.e. a non-main OME-TIFF from MicroManager or similar
+                    # in this case, because it's not the main file we want to
+                    # just role back to TiffReader
+                    if self._ome.binary_only:
+                        raise exceptions.UnsupportedFileFormatError(
+                            self.__class__.__name__, self._path
+                        )
+
+                    # Get and store scenes
+                    self._scenes: Tuple[str, ...] = tuple(
+                        image_meta.id for image_meta in self._ome.images
+                    )
+
+                    # Log a warning stating that if this is a MM OME-TIFF,
+                    # don't read many series
+                    if tiff.is_micromanager and not isinstance(
+                        self._fs, LocalFileSystem
+                    ):
+                        log.warning(
+                            "**Remote reading** (S3, GCS, HTTPS, etc.) of "
+                            "multi-image (or scene) OME-TIFFs created by "
+                            "MicroManager has limited support with the scene API. "
+                            "It is recommended to use independent AICSImage or "
+                            "Reader objects for each remote file instead of the "
+                            "`set_scene` API. "
+                            "Track progress on support here: "
+                            "https://github.com/AllenCellModeling/aicsimageio/"
+                            "issues/196"
+                        )
+
+        # Mirror the exception handling in _is_supported_image so direct
+        # construction still surfaces as an unsupported file
+        except (
+            TiffFileError,
+            TypeError,
+            ET.ParseError,
+            XMLSchemaValidationError,
+            URLError,
+        ) as e:
+            log.debug(f"Failed to read the provided file as an OME-TIFF. Error: {e}")
             raise exceptions.UnsupportedFileFormatError(
                 self.__class__.__name__, self._path
             )
 
-        # Get ome-types object and warn of other behaviors
-        with self._fs.open(self._path) as open_resource:
-            with TiffFile(open_resource) as tiff:
-                # Get and store OME
-                self._ome = self._get_ome(
-                    tiff.pages[0].description, self.clean_metadata
-                )
-
-                # Get and store scenes
-                self._scenes: Tuple[str, ...] = tuple(
-                    image_meta.id for image_meta in self._ome.images
-                )
-
-                # Log a warning stating that if this is a MM OME-TIFF, don't read
-                # many series
-                if tiff.is_micromanager and not isinstance(self._fs, LocalFileSystem):
-                    log.warning(
-                        "**Remote reading** (S3, GCS, HTTPS, etc.) of multi-image "
-                        "(or scene) OME-TIFFs created by MicroManager has limited "
-                        "support with the scene API. "
-                        "It is recommended to use independent AICSImage or Reader "
-                        "objects for each remote file instead of the `set_scene` API. "
-                        "Track progress on support here: "
-                        "https://github.com/AllenCellModeling/aicsimageio/issues/196"
-                    )
-
     @property
     def scenes(self) -> Tuple[str, ...]:
         return self._scenes
@@ -347,6 +383,14 @@ class OmeTiffReader(TiffReader):
         We currently do not handle unit attachment to these values. Please see the file
         metadata for unit information.
         """
-        return metadata_utils.physical_pixel_sizes(
-            self.metadata, self.current_scene_index
-        )
+        if self._physical_pixel_sizes_per_scene is None:
+            self._physical_pixel_sizes_per_scene = {}
+
+        if self.current_scene_index not in self._physical_pixel_sizes_per_scene:
+            self._physical_pixel_sizes_per_scene[
+                self.current_scene_index
+            ] = metadata_utils.physical_pixel_sizes(
+                self.metadata, self.current_scene_index
+            )
+
+        return self._physical_pixel_sizes_per_scene[self.current_scene_index]
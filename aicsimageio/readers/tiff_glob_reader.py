@@ -4,6 +4,7 @@
 import glob
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -26,9 +27,13 @@ from ..dimensions import (
 from ..metadata import utils as metadata_utils
 from ..utils import io_utils
 from .reader import Reader
+from .tiff_reader import TIFF_BYTE_ORDER_MARKS
 
 TIFF_IMAGE_DESCRIPTION_TAG_INDEX = 270
 
+# Compiled once at import, the indexers run this against every filename
+FILENAME_INDEX_PATTERN = re.compile(r"\d+")
+
 
 class TiffGlobReader(Reader):
     r"""
@@ -117,6 +122,13 @@ class TiffGlobReader(Reader):
     ) -> bool:
         try:
             with fs.open(path) as open_resource:
+                # Check the byte order mark before handing off to tifffile so
+                # that obviously-not-TIFF files are rejected without a header
+                # parse
+                if open_resource.read(2) not in TIFF_BYTE_ORDER_MARKS:
+                    return False
+
+                open_resource.seek(0)
                 with TiffFile(open_resource):
                     return True
 
@@ -167,7 +179,7 @@ class TiffGlobReader(Reader):
             # pd.Series([0,1,2,3], index=['S','T','C', 'Z'])
             def indexer(x: str) -> pd.Series:
                 return pd.Series(
-                    re.findall(r"\d+", Path(x).name), index=series_idx
+                    FILENAME_INDEX_PATTERN.findall(Path(x).name), index=series_idx
                 ).astype(int)
 
         if callable(indexer):
@@ -409,7 +421,24 @@ class TiffGlobReader(Reader):
 
         axes_order = self._get_axes_order(chunk_sizes, unpack_sizes)
         # Assemble array
-        arr = imread(scene_files.filename.tolist(), level=0)
+        # Read the per-file planes on a thread pool rather than serially;
+        # tifffile releases the GIL while decoding so the reads overlap
+        # Preallocate the full destination array from the first file's shape
+        # and dtype and decode each file straight into its slot to avoid a
+        # stack-time copy of the whole image
+        scene_filenames = scene_files.filename.tolist()
+        first_plane = imread(scene_filenames[0], level=0)
+        arr = np.empty(
+            (len(scene_filenames), *first_plane.shape), dtype=first_plane.dtype
+        )
+        arr[0] = first_plane
+        with ThreadPoolExecutor() as pool:
+            list(
+                pool.map(
+                    lambda args: imread(args[1], level=0, out=arr[args[0]]),
+                    enumerate(scene_filenames[1:], start=1),
+                )
+            )
         arr = arr.reshape(reshape_sizes)
         arr = arr.transpose(axes_order)
         arr = arr.reshape(tuple(chunk_sizes.values()))
@@ -612,6 +641,6 @@ class TiffGlobReader(Reader):
         -------
         pd.Series
         """
-        inds = re.findall(r"\d+", Path(path_to_img).name)
+        inds = FILENAME_INDEX_PATTERN.findall(Path(path_to_img).name)
         series = pd.Series(inds, index=["C", "S", "T", "Z"]).astype(int)
         return series
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask import delayed
+import zarr
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 from tifffile import TiffFile, TiffFileError, imread
 from tifffile.tifffile import TiffTags
@@ -24,6 +26,13 @@ from .reader import Reader
 UNKNOWN_DIM_CHARS = ["Q", "I"]
 TIFF_IMAGE_DESCRIPTION_TAG_INDEX = 270
 
+# Byte order marks accepted by tifffile: little endian, big endian, and
+# "EP" (Microsoft MDI, treated as little endian)
+# Deliberately only the two-byte mark: tifffile accepts several version words
+# after it (classic, BigTIFF, NIFF, Panasonic and Olympus RAW) so checking
+# further would risk rejecting files tifffile itself can open
+TIFF_BYTE_ORDER_MARKS = {b"II", b"MM", b"EP"}
+
 ###############################################################################
 
 
@@ -57,10 +66,23 @@ class TiffReader(Reader):
         Default: {}
     """
 
+    # IFD parsing for large files is expensive, cache the produced tags per scene
+    _tiff_tags_per_scene: Optional[Dict[int, TiffTags]] = None
+
+    # Guessed dimension orders are deterministic per scene, cache them as well
+    _guessed_dims_per_scene: Optional[Dict[int, List[str]]] = None
+
     @staticmethod
     def _is_supported_image(fs: AbstractFileSystem, path: str, **kwargs: Any) -> bool:
         try:
             with fs.open(path) as open_resource:
+                # Check the byte order mark before handing off to tifffile so
+                # that obviously-not-TIFF files are rejected without a header
+                # parse
+                if open_resource.read(2) not in TIFF_BYTE_ORDER_MARKS:
+                    return False
+
+                open_resource.seek(0)
                 with TiffFile(open_resource):
                     return True
 
@@ -137,12 +159,10 @@ class TiffReader(Reader):
         fs: AbstractFileSystem,
         path: str,
         scene: int,
-        retrieve_indices: Tuple[Union[int, slice]],
-        transpose_indices: List[int],
+        retrieve_indices: Tuple[Union[int, slice], ...],
     ) -> np.ndarray:
         """
-        Open a file for reading, construct a Zarr store, select data, and compute to
-        numpy.
+        Open a file for reading, construct a Zarr store, and select data to numpy.
 
         Parameters
         ----------
@@ -152,43 +172,142 @@ class TiffReader(Reader):
             The path to file to read.
         scene: int
             The scene index to pull the chunk from.
-        retrieve_indices: Tuple[Union[int, slice]]
-            The image indices to retrieve.
-        transpose_indices: List[int]
-            The indices to transpose to prior to requesting data.
+        retrieve_indices: Tuple[Union[int, slice], ...]
+            The image indices to retrieve, in the scene's native dimension order.
 
         Returns
         -------
         chunk: np.ndarray
             The image chunk as a numpy array.
         """
+        # For local files, hand tifffile the path instead of an fsspec file
+        # object so it can open (and memory-map) the file itself and benefit
+        # from OS page cache reuse across chunk reads
+        if isinstance(fs, LocalFileSystem):
+            with TiffFile(path) as tiff:
+                with tiff.series[scene].aszarr(level=0, chunkmode="page") as store:
+                    return zarr.open(store, mode="r")[retrieve_indices]
+
         with fs.open(path) as open_resource:
             with imread(
                 open_resource, aszarr=True, series=scene, level=0, chunkmode="page"
             ) as store:
-                arr = da.from_zarr(store)
-                arr = arr.transpose(transpose_indices)
+                # Index the store directly so that only the pages needed for
+                # this chunk are parsed and decoded.
+                # This avoids constructing (and optimizing, and computing) a
+                # throwaway dask graph for every chunk read.
+                return zarr.open(store, mode="r")[retrieve_indices]
+
+    @staticmethod
+    def _get_image_data_block(
+        fs: AbstractFileSystem,
+        path: str,
+        scene: int,
+        non_chunk_positions: List[Optional[int]],
+        chunk_shape: Tuple[int, ...],
+        block_info: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> np.ndarray:
+        """
+        map_blocks wrapper around _get_image_data.
+
+        Reads the chunk for the block's location in the blocked array and
+        reshapes it to the block's expected shape (size-one non-chunk
+        dimensions followed by the full chunk dimensions).
+
+        Parameters
+        ----------
+        fs: AbstractFileSystem
+            The file system to use for reading.
+        path: str
+            The path to file to read.
+        scene: int
+            The scene index to pull the chunk from.
+        non_chunk_positions: List[Optional[int]]
+            For each dimension in the scene's native order, the dimension's
+            position in the blocked array's non-chunk ordering, or None if
+            the dimension is chunked and should be retrieved in full.
+        chunk_shape: Tuple[int, ...]
+            The shape of a single chunk.
+        block_info: Optional[Dict[Any, Dict[str, Any]]]
+            The block metadata provided by da.map_blocks.
+
+        Returns
+        -------
+        block: np.ndarray
+            The image block as a numpy array.
+        """
+        chunk_location = block_info[None]["chunk-location"]  # type: ignore
+
+        # All dimensions get their block location index except for chunk dims
+        # which get filled with "full" slices
+        # Indices are constructed in the scene's native dimension order so
+        # that the chunk can be pulled straight from the zarr store
+        retrieve_indices = tuple(
+            chunk_location[position]
+            if position is not None
+            else slice(None, None, None)
+            for position in non_chunk_positions
+        )
+
+        chunk = TiffReader._get_image_data(fs, path, scene, retrieve_indices)
+
+        # Reintroduce the size-one non-chunk dimensions dropped by indexing
+        num_non_chunk_dims = len(chunk_location) - len(chunk_shape)
+        return chunk.reshape(((1,) * num_non_chunk_dims) + chunk_shape)
+
+    def _tiff_read_source(self) -> ContextManager[Any]:
+        """
+        Return a context manager yielding the object to hand to TiffFile.
+
+        For local files this is the plain path so that tifffile can open
+        (and memory-map) the file itself rather than streaming the decode
+        through an fsspec buffered file object.
+        """
+        if isinstance(self._fs, LocalFileSystem):
+            return nullcontext(self._path)
 
-                # By setting the compute call to always use a "synchronous" scheduler,
-                # it informs Dask not to look for an existing scheduler / client
-                # and instead simply read the data using the current thread / process.
-                # In doing so, we shouldn't run into any worker data transfer and
-                # handoff _during_ a read.
-                return arr[retrieve_indices].compute(scheduler="synchronous")
+        return self._fs.open(self._path)
 
     def _get_tiff_tags(self, tiff: TiffFile) -> TiffTags:
-        unprocessed_tags = tiff.series[self.current_scene_index].pages[0].tags
+        if self._tiff_tags_per_scene is None:
+            self._tiff_tags_per_scene = {}
 
-        # Create dict of tag and value
-        tags: Dict[int, str] = {}
-        for code, tag in unprocessed_tags.items():
-            tags[code] = tag.value
+        # Fill cache on first access for the current scene so that repeat
+        # delayed and immediate reads don't re-walk the IFD chain
+        if self.current_scene_index not in self._tiff_tags_per_scene:
+            unprocessed_tags = tiff.series[self.current_scene_index].pages[0].tags
 
-        return tags
+            # Create dict of tag and value
+            tags: Dict[int, str] = {}
+            for code, tag in unprocessed_tags.items():
+                tags[code] = tag.value
+
+            self._tiff_tags_per_scene[self.current_scene_index] = tags
+
+        return self._tiff_tags_per_scene[self.current_scene_index]
+
+    def _get_metadata_attrs(self, tiff: TiffFile) -> Dict[str, Any]:
+        # Get unprocessed metadata from tags
+        tiff_tags = self._get_tiff_tags(tiff)
+
+        # Try accepted processed metadata
+        try:
+            return {
+                constants.METADATA_UNPROCESSED: tiff_tags,
+                constants.METADATA_PROCESSED: tiff_tags[
+                    TIFF_IMAGE_DESCRIPTION_TAG_INDEX
+                ],
+            }
+        except KeyError:
+            return {constants.METADATA_UNPROCESSED: tiff_tags}
 
     @staticmethod
     def _merge_dim_guesses(dims_from_meta: str, guessed_dims: str) -> str:
         # Construct a "best guess" (super naive)
+        # Track the dims that can no longer be guessed (anything in the meta
+        # string plus anything already appended) in a set so the inner loop
+        # does constant-time membership checks instead of scanning two lists
+        unavailable_dims = set(dims_from_meta)
         best_guess = []
         for dim_from_meta in dims_from_meta:
             # Dim from meta is recognized, add it
@@ -200,11 +319,9 @@ class TiffReader(Reader):
             else:
                 appended_dim = False
                 for guessed_dim in guessed_dims:
-                    if (
-                        guessed_dim not in best_guess
-                        and guessed_dim not in dims_from_meta
-                    ):
+                    if guessed_dim not in unavailable_dims:
                         best_guess.append(guessed_dim)
+                        unavailable_dims.add(guessed_dim)
                         appended_dim = True
                         break
 
@@ -216,18 +333,31 @@ class TiffReader(Reader):
         return "".join(best_guess)
 
     def _guess_tiff_dim_order(self, tiff: TiffFile) -> List[str]:
-        scene = tiff.series[self.current_scene_index]
-        dims_from_meta = scene.pages.axes
+        if self._guessed_dims_per_scene is None:
+            self._guessed_dims_per_scene = {}
 
-        # If all dims are known, simply return as list
-        if all(i not in UNKNOWN_DIM_CHARS for i in dims_from_meta):
-            return [d for d in dims_from_meta]
+        # The guess only depends on the scene's axes and shape, so compute it
+        # once per scene instead of on every delayed / immediate read
+        if self.current_scene_index not in self._guessed_dims_per_scene:
+            scene = tiff.series[self.current_scene_index]
+            dims_from_meta = scene.pages.axes
 
-        # Otherwise guess the dimensions and return merge
-        else:
-            # Get basic guess from shape size
-            guessed_dims = Reader._guess_dim_order(scene.shape)
-            return [d for d in self._merge_dim_guesses(dims_from_meta, guessed_dims)]
+            # If all dims are known, simply use as list
+            if all(i not in UNKNOWN_DIM_CHARS for i in dims_from_meta):
+                guess = [d for d in dims_from_meta]
+
+            # Otherwise guess the dimensions and merge
+            else:
+                # Get basic guess from shape size
+                guessed_dims = Reader._guess_dim_order(scene.shape)
+                guess = [
+                    d for d in self._merge_dim_guesses(dims_from_meta, guessed_dims)
+                ]
+
+            self._guessed_dims_per_scene[self.current_scene_index] = guess
+
+        # Return a copy so callers can't mutate the cached guess
+        return list(self._guessed_dims_per_scene[self.current_scene_index])
 
     def _get_dims_for_scene(self, tiff: TiffFile) -> List[str]:
         # Get / guess dims
@@ -363,44 +493,36 @@ class TiffReader(Reader):
                 non_chunk_dim_order.append(dim)
                 non_chunk_shape.append(size)
 
-        # Fill out the rest of the blocked shape with dimension sizes of 1 to
-        # match the length of the sample chunk
-        # When dask.block happens it fills the dimensions from inner-most to
-        # outer-most with the chunks as long as the dimension is size 1
+        # The blocked dim order is the non-chunk dims (each of size one per
+        # block) followed by the chunk dims (each read in full per block)
         blocked_dim_order = non_chunk_dim_order + chunk_dim_order
-        blocked_shape = tuple(non_chunk_shape) + ((1,) * len(chunk_shape))
-
-        # Construct the transpose indices that will be used to
-        # transpose the array prior to pulling the chunk dims
-        match_map = {dim: selected_scene_dims.find(dim) for dim in selected_scene_dims}
-        transposer = []
-        for dim in blocked_dim_order:
-            transposer.append(match_map[dim])
-
-        # Make ndarray for lazy arrays to fill
-        lazy_arrays: np.ndarray = np.ndarray(blocked_shape, dtype=object)
-        for np_index, _ in np.ndenumerate(lazy_arrays):
-            # All dimensions get their normal index except for chunk dims
-            # which get filled with "full" slices
-            indices_with_slices = np_index[: len(non_chunk_shape)] + (
-                (slice(None, None, None),) * len(chunk_shape)
-            )
 
-            # Fill the numpy array with the delayed arrays
-            lazy_arrays[np_index] = da.from_delayed(
-                delayed(TiffReader._get_image_data)(
-                    fs=self._fs,
-                    path=self._path,
-                    scene=self.current_scene_index,
-                    retrieve_indices=indices_with_slices,
-                    transpose_indices=transposer,
-                ),
-                shape=chunk_shape,
-                dtype=selected_scene.dtype,
-            )
-
-        # Convert the numpy array of lazy readers into a dask array
-        image_data = da.block(lazy_arrays.tolist())
+        # Map each dimension in the scene's native order to its position in the
+        # non-chunk dimension ordering (None means the dimension is chunked and
+        # will be retrieved in full)
+        non_chunk_positions = [
+            non_chunk_dim_order.index(dim) if dim in non_chunk_dim_order else None
+            for dim in selected_scene_dims
+        ]
+
+        # Construct the blocked array with a single map_blocks call rather
+        # than one delayed object (and graph layer) per chunk
+        # Each non-chunk dimension contributes blocks of size one and each
+        # chunk dimension is read in full per block, so each block maps to
+        # exactly one _get_image_data call
+        blocked_chunks = tuple((1,) * size for size in non_chunk_shape) + tuple(
+            (size,) for size in chunk_shape
+        )
+        image_data = da.map_blocks(
+            TiffReader._get_image_data_block,
+            dtype=selected_scene.dtype,
+            chunks=blocked_chunks,
+            fs=self._fs,
+            path=self._path,
+            scene=self.current_scene_index,
+            non_chunk_positions=non_chunk_positions,
+            chunk_shape=tuple(chunk_shape),
+        )
 
         # Because we have set certain dimensions to be chunked and others not
         # we will need to transpose back to original dimension ordering
@@ -443,9 +565,6 @@ class TiffReader(Reader):
                 # Create the delayed dask array
                 image_data = self._create_dask_array(tiff, dims)
 
-                # Get unprocessed metadata from tags
-                tiff_tags = self._get_tiff_tags(tiff)
-
                 # Get channel names for this scene or generate
                 channels = self._get_channel_names_for_scene(image_data.shape, dims)
 
@@ -457,16 +576,8 @@ class TiffReader(Reader):
                     channel_names=channels,
                 )
 
-                # Try accepted processed metadata
-                try:
-                    attrs = {
-                        constants.METADATA_UNPROCESSED: tiff_tags,
-                        constants.METADATA_PROCESSED: tiff_tags[
-                            TIFF_IMAGE_DESCRIPTION_TAG_INDEX
-                        ],
-                    }
-                except KeyError:
-                    attrs = {constants.METADATA_UNPROCESSED: tiff_tags}
+                # Unpack processed and unprocessed metadata
+                attrs = self._get_metadata_attrs(tiff)
 
                 return xr.DataArray(
                     image_data,
@@ -490,17 +601,16 @@ class TiffReader(Reader):
         exceptions.UnsupportedFileFormatError
             The file could not be read or is not supported.
         """
-        with self._fs.open(self._path) as open_resource:
+        with self._tiff_read_source() as open_resource:
             with TiffFile(open_resource) as tiff:
                 # Get dims from provided or guess
                 dims = self._get_dims_for_scene(tiff)
 
                 # Read image into memory
+                # Note: this only decodes the pages belonging to the
+                # currently selected scene, not the whole file
                 image_data = tiff.series[self.current_scene_index].asarray()
 
-                # Get unprocessed metadata from tags
-                tiff_tags = self._get_tiff_tags(tiff)
-
                 # Get channel names for this scene or generate
                 channels = self._get_channel_names_for_scene(image_data.shape, dims)
 
@@ -512,16 +622,8 @@ class TiffReader(Reader):
                     channel_names=channels,
                 )
 
-                # Try accepted processed metadata
-                try:
-                    attrs = {
-                        constants.METADATA_UNPROCESSED: tiff_tags,
-                        constants.METADATA_PROCESSED: tiff_tags[
-                            TIFF_IMAGE_DESCRIPTION_TAG_INDEX
-                        ],
-                    }
-                except KeyError:
-                    attrs = {constants.METADATA_UNPROCESSED: tiff_tags}
+                # Unpack processed and unprocessed metadata
+                attrs = self._get_metadata_attrs(tiff)
 
                 return xr.DataArray(
                     image_data,
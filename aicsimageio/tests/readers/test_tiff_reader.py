@@ -8,7 +8,9 @@ from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pytest
+import tifffile
 from distributed import Client, LocalCluster
+from fsspec.implementations.local import LocalFileSystem
 
 from aicsimageio import AICSImage, dimensions, exceptions
 from aicsimageio.readers import TiffReader
@@ -250,6 +252,77 @@ def test_merge_dim_guesses(
     assert TiffReader._merge_dim_guesses(dims_from_meta, guessed_dims) == expected
 
 
+@pytest.mark.parametrize(
+    "write_kwargs, expected_magic",
+    [
+        ({}, b"II*\x00"),
+        ({"byteorder": ">"}, b"MM\x00*"),
+        ({"bigtiff": True}, b"II+\x00"),
+        ({"bigtiff": True, "byteorder": ">"}, b"MM\x00+"),
+    ],
+)
+def test_is_supported_image_accepts_all_tiff_magic_bytes(
+    write_kwargs: Dict[str, Any], expected_magic: bytes
+) -> None:
+    fs = LocalFileSystem()
+
+    with TemporaryDirectory() as tmpdir:
+        save_path = Path(tmpdir) / "img.tiff"
+        tifffile.imwrite(save_path, np.zeros((4, 4), dtype=np.uint8), **write_kwargs)
+
+        # Ensure the write produced the magic bytes under test
+        with open(save_path, "rb") as open_resource:
+            assert open_resource.read(4) == expected_magic
+
+        assert TiffReader._is_supported_image(fs, str(save_path))
+
+
+@pytest.mark.parametrize(
+    "byteorder, header",
+    [
+        # "EP" (Microsoft MDI) byte order mark, treated as little endian
+        ("<", b"EP*\x00"),
+        # Panasonic RAW version word, both byte orders
+        ("<", b"IIU\x00"),
+        (">", b"MM\x00U"),
+        # NIFF version word
+        ("<", b"II1N"),
+        # Olympus RAW version word
+        ("<", b"IIRO"),
+    ],
+)
+def test_is_supported_image_is_never_narrower_than_tifffile(
+    byteorder: str, header: bytes
+) -> None:
+    # tifffile accepts more than the classic and BigTIFF headers, so the
+    # byte order mark fast-reject must accept everything tifffile can open
+    fs = LocalFileSystem()
+
+    with TemporaryDirectory() as tmpdir:
+        save_path = Path(tmpdir) / "img.tiff"
+        tifffile.imwrite(
+            save_path, np.zeros((4, 4), dtype=np.uint8), byteorder=byteorder
+        )
+        with open(save_path, "r+b") as open_resource:
+            open_resource.write(header)
+
+        # Ensure tifffile itself accepts this header
+        with tifffile.TiffFile(save_path):
+            pass
+
+        assert TiffReader._is_supported_image(fs, str(save_path))
+
+
+def test_is_supported_image_rejects_non_tiff() -> None:
+    fs = LocalFileSystem()
+
+    with TemporaryDirectory() as tmpdir:
+        save_path = Path(tmpdir) / "img.bin"
+        save_path.write_bytes(b"not a tiff")
+
+        assert not TiffReader._is_supported_image(fs, str(save_path))
+
+
 def test_micromanager_ome_tiff_binary_file() -> None:
     # Construct full filepath
     uri = get_resource_full_path(
@@ -23,11 +23,11 @@ def reduce_to_slice(L: Union[List, Tuple]) -> Union[int, List, slice, Tuple]:
     # if the list has at least 2 elements we can check for sliceable
     # it is convertable to a slice if the step size between each
     # consecutive pair of elements is equal and positive
-    # 1. get all the deltas in a list:
-    steps = [(L[i + 1] - L[i]) for i in range(len(L) - 1)]
+    # 1. get all the deltas in a single vectorized pass:
+    steps = np.diff(L)
     # 2. check if all the deltas are equal and positive
-    if steps[0] > 0 and steps.count(steps[0]) == len(steps):
-        return slice(min(L), max(L) + 1, steps[0])
+    if steps[0] > 0 and np.all(steps == steps[0]):
+        return slice(min(L), max(L) + 1, int(steps[0]))
     # if we can't convert to a slice, then just return the list unmodified
     return L
 